@@ -1,8 +1,10 @@
 import base64
 import json
 import logging
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 from rest_framework.exceptions import ValidationError
 
 from care_odoo.settings import plugin_settings
@@ -10,14 +12,29 @@ from care_odoo.settings import plugin_settings
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """Create a process-wide session so connections to Odoo are kept alive and reused."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class OdooConnector:
+    _session = _build_session()
+
     @classmethod
-    def call_api(cls, endpoint: str, data: dict, method: str = "POST") -> dict:
+    def call_api(
+        cls, endpoint: str, data: dict | str | bytes, method: str = "POST", params: dict | None = None
+    ) -> dict:
         """Call a custom Odoo addon API endpoint.
 
         Args:
             endpoint: The API endpoint path (e.g. '/api/create_invoice')
-            data: The data to send in the request body
+            data: The data to send in the request body, either as a dict or as
+                an already serialized JSON document (e.g. from ``model_dump_json()``)
+            params: Optional query parameters, percent-encoded by the HTTP client
 
         Returns:
             dict: The JSON response from the API
@@ -43,27 +60,43 @@ class OdooConnector:
             "db": plugin_settings.CARE_ODOO_DATABASE,
         }
 
-        # Log curl equivalent for debugging
-        try:
-            headers_str = " ".join([f"-H '{k}: {v}'" for k, v in headers.items()])
-            data_str = f"-d '{json.dumps(data)}'" if data else ""
-            curl_command = f"curl -X {method} {headers_str} {data_str} '{url}'"
-            logger.info("Equivalent curl command:\n%s", curl_command)
-        except Exception as e:
-            logger.info(e)
+        # Log curl equivalent for debugging; it carries the payload (patient details) and the
+        # credentials, so it is only built when DEBUG logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                headers_str = " ".join([f"-H '{k}: {v}'" for k, v in headers.items()])
+                if isinstance(data, bytes):
+                    data_str = f"-d '{data.decode()}'"
+                elif isinstance(data, str):
+                    data_str = f"-d '{data}'"
+                else:
+                    data_str = f"-d '{json.dumps(data)}'" if data else ""
+                query_str = f"?{urlencode(params, doseq=True)}" if params else ""
+                curl_command = f"curl -X {method} {headers_str} {data_str} '{url}{query_str}'"
+                logger.debug("Equivalent curl command:\n%s", curl_command)
+            except Exception as e:
+                logger.debug(e)
+
+        # Pre-serialized payloads are sent as-is to skip re-encoding them
+        if isinstance(data, str):
+            body = {"data": data.encode()}
+        elif isinstance(data, bytes):
+            body = {"data": data}
+        else:
+            body = {"json": data}
 
         try:
-            response = requests.request(method, url, headers=headers, json=data, timeout=30)
+            response = cls._session.request(method, url, headers=headers, params=params, timeout=30, **body)
             logger.info("Odoo API Response Status Code: %s", url)
             logger.info("Odoo API Response Status: %s", response.status_code)
-            logger.info("Odoo API Raw Response: %s", response.text)
+            logger.debug("Odoo API Raw Response: %s", response.text)
 
             response_json = response.json()
-            logger.info("Odoo API Response JSON: %s", response_json)
+            logger.debug("Odoo API Response JSON: %s", response_json)
 
             if not response.ok:
                 error_msg = response_json.get("message", str(response.reason))
-                logger.exception("Odoo API Response Error: %s", error_msg)
+                logger.error("Odoo API Response Error: %s", error_msg)
                 raise ValidationError(str(error_msg))
 
             return response_json
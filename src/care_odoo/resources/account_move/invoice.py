@@ -19,11 +19,10 @@ from care_odoo.resources.product_category.spec import CategoryData
 from care_odoo.resources.product_product.spec import ProductData, TaxData
 from care_odoo.resources.res_partner.spec import PartnerData, PartnerType
 from care_odoo.resources.utils import (
+    classify_price_components,
     format_date,
     format_datetime_to_local_date,
     get_all_discounts,
-    get_base_price_from_charge_item,
-    get_purchase_price_from_charge_item,
     get_taxes_from_definition,
 )
 from care_odoo.settings import plugin_settings
@@ -105,8 +104,9 @@ class OdooInvoiceResource:
         invoice_items = []
         for charge_item in ChargeItem.objects.filter(paid_invoice=invoice).select_related("charge_item_definition"):
             if charge_item.charge_item_definition:
-                base_price = get_base_price_from_charge_item(charge_item, raise_if_not_found=True)
-                purchase_price = get_purchase_price_from_charge_item(charge_item)
+                unit_price_components = classify_price_components(charge_item.unit_price_components, raise_if_not_found=True)
+                base_price = unit_price_components["base"]
+                purchase_price = unit_price_components["purchase_price"]
                 taxes = []
                 for tax in get_taxes_from_definition(charge_item.charge_item_definition):
                     taxes.append(
@@ -9,6 +9,7 @@ from care_odoo.resources.account_move_payment.spec import (
     CustomerType,
     JournalType,
     PaymentMode,
+    check_payment_method_line,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "CustomerType",
     "JournalType",
     "PaymentMode",
+    "check_payment_method_line",
 ]
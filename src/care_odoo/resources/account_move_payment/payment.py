@@ -1,12 +1,13 @@
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 from care.emr.models.payment_reconciliation import PaymentReconciliation
-from care.emr.resources.base import model_from_cache
+from care.emr.models.tag_config import TagConfig
 from care.emr.resources.payment_reconciliation.spec import (
     PaymentReconciliationPaymentMethodOptions,
 )
-from care.emr.resources.tag.config_spec import TagConfigReadSpec
 from rest_framework.exceptions import ValidationError
 
 from care_odoo.connector.connector import OdooConnector
@@ -17,6 +18,7 @@ from care_odoo.resources.account_move_payment.spec import (
     CustomerType,
     JournalType,
     PaymentMode,
+    check_payment_method_line,
 )
 from care_odoo.resources.res_partner.spec import PartnerData, PartnerType
 from care_odoo.resources.utils import format_datetime_to_local_date
@@ -72,18 +74,28 @@ class OdooPaymentResource:
     # Extension key for credit payment data
     CREDIT_EXTENSION_KEY = "payment_reconciliation_credit_extension"
 
-    def _get_credit_payment_method_line_id(self, payment: PaymentReconciliation) -> int | None:
+    def _get_credit_payment_method_line_id(self, extensions: dict | None) -> int | None:
         """
         Return the payment_method_line_id from the credit extension, or None if unset/invalid.
 
         The credit extension lives under 'payment_reconciliation_credit_extension' and is
         only meaningful for cdac (Care of Account) credit payments.
         """
-        credit_ext = (payment.extensions or {}).get(self.CREDIT_EXTENSION_KEY) or {}
+        # Most payments carry no extensions at all
+        if not extensions:
+            return None
+
+        credit_ext = extensions.get(self.CREDIT_EXTENSION_KEY)
+        if not credit_ext:
+            return None
+
+        payment_method_line_id = credit_ext.get("payment_method_line_id")
+        if isinstance(payment_method_line_id, int):
+            return payment_method_line_id
 
         # Convert string ID to int (matching insurance_company pattern)
         try:
-            return int(credit_ext.get("payment_method_line_id"))
+            return int(payment_method_line_id)
         except (ValueError, TypeError):
             return None
 
@@ -96,16 +108,20 @@ class OdooPaymentResource:
             insurance_tag_external_id: The external_id (UUID) of the insurance tag from settings
 
         Returns:
-            True if account has the insurance tag, False otherwise
+            True if account has the insurance tag, False otherwise (including when
+            insurance_tag_external_id is not a valid UUID)
         """
         if not insurance_tag_external_id or not account_tags:
             return False
 
-        for tag_id in account_tags:
-            cached_tag = model_from_cache(TagConfigReadSpec, id=tag_id)
-            if cached_tag and str(cached_tag.get("id")) == insurance_tag_external_id:
-                return True
-        return False
+        try:
+            uuid.UUID(str(insurance_tag_external_id))
+        except ValueError:
+            logger.warning("CARE_INSURANCE_TAG_ID is not a valid UUID: %s", insurance_tag_external_id)
+            return False
+
+        # Resolve membership in a single query rather than a cache lookup per tag
+        return TagConfig.objects.filter(id__in=account_tags, external_id=insurance_tag_external_id).exists()
 
     def sync_payment_to_odoo_api(self, payment_id: str) -> int | None:
         """
@@ -128,13 +144,42 @@ class OdooPaymentResource:
         Raises:
             ValidationError: If cash payment attempted without open session
             ValidationError: If issuer is set but insurance configuration is missing
+            ValidationError: If the location, creator or patient phone number is missing
         """
-        payment = PaymentReconciliation.objects.select_related(
-            "facility", "account", "account__patient", "target_invoice", "location", "created_by"
-        ).get(external_id=payment_id)
+        data = self._build_payment_data(payment_id)
+        if data is None:
+            return None
+        return self._post_payment(data)
+
+    def _build_payment_data(self, payment_id: str) -> str | None:
+        """Build the Odoo payload for a payment reconciliation, or None if it is not sent to Odoo."""
+        # Fetch only the columns needed for the payload as a flat dict; this avoids
+        # hydrating the payment and its related model instances
+        payment = (
+            PaymentReconciliation.objects.filter(external_id=payment_id)
+            .values(
+                "external_id",
+                "amount",
+                "method",
+                "payment_datetime",
+                "is_credit_note",
+                "reference_number",
+                "issuer_type",
+                "extensions",
+                "account__patient__name",
+                "account__patient__external_id",
+                "account__patient__phone_number",
+                "account__tags",
+                "target_invoice__external_id",
+                "location__external_id",
+                "location__name",
+                "created_by__external_id",
+            )
+            .get()
+        )
 
         # Handle insurance company id when issuer is set
-        if payment.issuer_type == "insurer":
+        if payment["issuer_type"] == "insurer":
             # Validate insurance configuration
             insurance_tag_id = plugin_settings.CARE_INSURANCE_TAG_ID
 
@@ -143,7 +188,7 @@ class OdooPaymentResource:
 
             # Check if account has the insurance tag
             # Note: insurance_tag_id is an external_id (UUID), account_tags contains database IDs
-            account_tags = payment.account.tags or []
+            account_tags = payment["account__tags"] or []
             has_insurance_tag_flag = self.has_insurance_tag(account_tags, insurance_tag_id)
 
             if not has_insurance_tag_flag:
@@ -152,44 +197,56 @@ class OdooPaymentResource:
             # Skip without creating payment in Odoo
             return None
 
-        # Prepare partner data
-        partner_data = PartnerData(
-            name=payment.account.patient.name,
-            x_care_id=str(payment.account.patient.external_id),
-            partner_type=PartnerType.person,
-            phone=payment.account.patient.phone_number,
-            state="kerala",
-            email="",
-            agent=False,
-        )
-
         # Determine journal type; cdac (Care of Account) is a credit flow that
-        # carries a payment_method_line_id. The credit/non-credit invariant is
-        # enforced by AccountMovePaymentApiRequest.
-        journal_type = PAYMENT_METHOD_TO_JOURNAL_TYPE.get(payment.method, JournalType.bank)
-        payment_method_line_id = self._get_credit_payment_method_line_id(payment)
-
-        # Prepare payment data
-        data = AccountMovePaymentApiRequest(
-            journal_x_care_id=str(payment.target_invoice.external_id if payment.target_invoice else ""),
-            x_care_id=str(payment.external_id),
-            amount=float(payment.amount),
+        # carries a payment_method_line_id.
+        journal_type = PAYMENT_METHOD_TO_JOURNAL_TYPE.get(payment["method"], JournalType.bank)
+        payment_method_line_id = self._get_credit_payment_method_line_id(payment["extensions"])
+
+        check_payment_method_line(journal_type, payment_method_line_id)
+
+        # model_construct skips validation, so reject missing relations here instead of
+        # sending "None" ids or null strings to Odoo
+        if payment["location__external_id"] is None:
+            raise ValidationError("Payment must have a location to sync to Odoo")
+        if payment["created_by__external_id"] is None:
+            raise ValidationError("Payment must have a creator to sync to Odoo")
+        if payment["account__patient__external_id"] is None or payment["account__patient__phone_number"] is None:
+            raise ValidationError("Payment account must have a patient with a phone number to sync to Odoo")
+
+        # The payload is built from trusted Care data, so construct it without running
+        # pydantic validation. It is serialized by pydantic so the connector can send it
+        # without re-encoding.
+        data = AccountMovePaymentApiRequest.model_construct(
+            journal_x_care_id=str(payment["target_invoice__external_id"] or ""),
+            x_care_id=str(payment["external_id"]),
+            amount=payment["amount"],
             journal_input=journal_type,
             payment_method_line_id=payment_method_line_id,
-            bank_reference=payment.reference_number,
-            payment_date=format_datetime_to_local_date(payment.payment_datetime),
-            payment_mode=PaymentMode.send if payment.is_credit_note else PaymentMode.receive,
-            partner_data=partner_data,
+            bank_reference=payment["reference_number"],
+            payment_date=format_datetime_to_local_date(payment["payment_datetime"]),
+            payment_mode=PaymentMode.send if payment["is_credit_note"] else PaymentMode.receive,
+            partner_data=PartnerData.model_construct(
+                name=payment["account__patient__name"],
+                x_care_id=str(payment["account__patient__external_id"]),
+                partner_type=PartnerType.person,
+                phone=payment["account__patient__phone_number"],
+                state="kerala",
+                email="",
+                agent=False,
+            ),
             customer_type=CustomerType.customer,
-            counter_data=BillCounterData(
-                x_care_id=str(payment.location.external_id),
-                cashier_id=str(payment.created_by.external_id),
-                counter_name=payment.location.name,
+            counter_data=BillCounterData.model_construct(
+                x_care_id=str(payment["location__external_id"]),
+                cashier_id=str(payment["created_by__external_id"]),
+                counter_name=payment["location__name"],
             ),
-        ).model_dump()
+        ).model_dump_json()
 
-        logger.info("Odoo Payment Data: %s", data)
+        logger.debug("Odoo Payment Data: %s", data)
+        return data
 
+    def _post_payment(self, data: dict | str) -> int:
+        """Send a payment payload to Odoo and return the Odoo payment ID."""
         response = OdooConnector.call_api("api/account/move/payment", data)
         return response["payment"]["id"]
 
@@ -210,7 +267,7 @@ class OdooPaymentResource:
             reason=payment.status,
         ).model_dump()
 
-        logger.info("Odoo Payment Cancel Data: %s", data)
+        logger.debug("Odoo Payment Cancel Data: %s", data)
 
         response = OdooConnector.call_api("api/account/move/payment/cancel", data)
         return response["payment"]["id"]
@@ -249,6 +306,10 @@ class OdooPaymentResource:
 
             odoo_payment_id = OdooPaymentResource().sync_credit_payment_to_odoo_api(payment_data)
         """
+        return self._post_payment(self._build_credit_payment_data(credit_payment))
+
+    def _build_credit_payment_data(self, credit_payment: CreditPaymentData) -> dict:
+        """Build the Odoo payload for a credit (Care of Account) payment."""
         partner_data = PartnerData(
             name=credit_payment.patient_name,
             x_care_id=credit_payment.patient_external_id,
@@ -259,6 +320,8 @@ class OdooPaymentResource:
             agent=False,
         )
 
+        check_payment_method_line(JournalType.credit, credit_payment.payment_method_line_id)
+
         data = AccountMovePaymentApiRequest(
             journal_x_care_id=credit_payment.invoice_external_id or "",
             x_care_id=credit_payment.x_care_id,
@@ -277,7 +340,52 @@ class OdooPaymentResource:
             ),
         ).model_dump()
 
-        logger.info("Odoo Credit Payment Data: %s", data)
+        logger.debug("Odoo Credit Payment Data: %s", data)
+        return data
 
-        response = OdooConnector.call_api("api/account/move/payment", data)
-        return response["payment"]["id"]
+    def sync_payments_batch(
+        self, payments: list[str | CreditPaymentData], max_workers: int = 8
+    ) -> list[int | None | Exception]:
+        """
+        Synchronize a mixed batch of regular and credit payments to Odoo concurrently.
+
+        Payloads are built up front on the calling thread, so the database reads see the
+        caller's open transaction and only the HTTP calls run on the thread pool. A failing
+        payment does not abort the rest of the batch.
+
+        Args:
+            payments: External IDs of payment reconciliations and/or CreditPaymentData items
+            max_workers: Maximum number of concurrent Odoo calls
+
+        Returns:
+            One entry per input, in order: the Odoo payment ID, None, or the raised exception
+        """
+        payloads: list[dict | str | None | Exception] = []
+        for payment in payments:
+            try:
+                if isinstance(payment, CreditPaymentData):
+                    payloads.append(self._build_credit_payment_data(payment))
+                else:
+                    payloads.append(self._build_payment_data(payment))
+            except Exception as e:
+                x_care_id = payment.x_care_id if isinstance(payment, CreditPaymentData) else payment
+                logger.exception("Failed to build Odoo payload for payment %s: %s", x_care_id, str(e))
+                payloads.append(e)
+
+        results: list[int | None | Exception] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._post_payment, data) if isinstance(data, dict | str) else data
+                for data in payloads
+            ]
+            for payment, future in zip(payments, futures, strict=True):
+                if future is None or isinstance(future, Exception):
+                    results.append(future)
+                    continue
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    x_care_id = payment.x_care_id if isinstance(payment, CreditPaymentData) else payment
+                    logger.exception("Failed to sync payment %s to Odoo: %s", x_care_id, str(e))
+                    results.append(e)
+        return results
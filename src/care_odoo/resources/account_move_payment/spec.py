@@ -1,7 +1,8 @@
 from decimal import Decimal
 from enum import Enum
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, field_serializer
+from rest_framework.exceptions import ValidationError
 
 from care_odoo.resources.res_partner.spec import PartnerData
 
@@ -44,19 +45,28 @@ class AccountMovePaymentApiRequest(BaseModel):
     # For credit payments - specifies which charity/fund is paying
     payment_method_line_id: int | None = None
 
-    @model_validator(mode="after")
-    def validate_payment_method_line(self):
-        """payment_method_line_id is required for, and only allowed on, credit payments."""
-        is_credit = self.journal_input == JournalType.credit
-        if is_credit and not self.payment_method_line_id:
-            raise ValueError(
-                "Credit Source is required for credit (Care of Account) payments. "
-            )
-        if not is_credit and self.payment_method_line_id:
-            raise ValueError(
-                "Credit Source is only allowed for credit (Care of Account) payments."
-            )
-        return self
+    @field_serializer("amount", when_used="json")
+    def serialize_amount(self, amount: Decimal) -> float:
+        """Dump amount as a JSON number."""
+        return float(amount)
+
+
+def check_payment_method_line(journal_input: JournalType, payment_method_line_id: int | None) -> None:
+    """
+    payment_method_line_id is required for, and only allowed on, credit payments.
+
+    Kept out of AccountMovePaymentApiRequest as a model validator so internal callers
+    can build requests with model_construct() and still enforce the invariant cheaply.
+    """
+    is_credit = journal_input == JournalType.credit
+    if is_credit and not payment_method_line_id:
+        raise ValidationError(
+            "Credit Source is required for credit (Care of Account) payments. "
+        )
+    if not is_credit and payment_method_line_id:
+        raise ValidationError(
+            "Credit Source is only allowed for credit (Care of Account) payments."
+        )
 
 
 class AccountPaymentCancelApiRequest(BaseModel):
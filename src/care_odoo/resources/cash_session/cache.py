@@ -0,0 +1,63 @@
+"""
+Short-lived caching of Odoo cash session reads.
+
+Counters change rarely and the current session is polled by the billing UI, so both
+are cached for a few seconds and invalidated when a session is opened or closed.
+"""
+
+from django.core.cache import cache
+
+from care_odoo.connector.connector import OdooConnector
+
+COUNTERS_CACHE_TIMEOUT = 30
+CURRENT_SESSION_CACHE_TIMEOUT = 5
+
+
+# Odoo's counters endpoint is not filtered by facility, so a single key holds the response
+COUNTERS_CACHE_KEY = "odoo:cash:counters"
+
+
+def current_session_cache_key(user_external_id: str, counter_x_care_id: str) -> str:
+    return f"odoo:cash:session:current:{user_external_id}:{counter_x_care_id}"
+
+
+def _get_or_fetch(key: str, fetch, timeout: int) -> dict:
+    """Return the cached Odoo response for key, calling fetch on a miss and caching only successful responses."""
+    response = cache.get(key)
+    if response is None:
+        response = fetch()
+        if response.get("success"):
+            cache.set(key, response, timeout)
+    return response
+
+
+def get_counters() -> dict:
+    """Return the Odoo counters response, served from cache when available."""
+    return _get_or_fetch(
+        COUNTERS_CACHE_KEY,
+        lambda: OdooConnector.call_api("api/care/cash/counters", {}, "GET"),
+        COUNTERS_CACHE_TIMEOUT,
+    )
+
+
+def get_current_session(user_external_id: str, counter_x_care_id: str) -> dict:
+    """Return the Odoo current-session response for a user at a counter, served from cache when available."""
+    data = {
+        "external_user_id": user_external_id,
+        "counter_x_care_id": counter_x_care_id,
+    }
+    return _get_or_fetch(
+        current_session_cache_key(user_external_id, counter_x_care_id),
+        lambda: OdooConnector.call_api("api/care/cash/session/current", data, "POST"),
+        CURRENT_SESSION_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_session_cache(user_external_id: str, counter_x_care_id: str) -> None:
+    """Drop cached counter and current-session reads after a session changes state."""
+    cache.delete_many(
+        [
+            COUNTERS_CACHE_KEY,
+            current_session_cache_key(user_external_id, counter_x_care_id),
+        ]
+    )
@@ -1,7 +1,7 @@
 from decimal import Decimal
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class SessionStatus(str, Enum):
@@ -17,6 +17,11 @@ class OpenSessionRequest(BaseModel):
     counter_x_care_id: str = Field(..., description="Counter/location Care ID")
     opening_balance: Decimal = Field(default=Decimal("0.0"), description="Opening balance amount")
 
+    @field_serializer("opening_balance", when_used="json")
+    def serialize_opening_balance(self, opening_balance: Decimal) -> float:
+        """Dump opening_balance as a JSON number."""
+        return float(opening_balance)
+
 
 class CloseSessionRequest(BaseModel):
     """Request to close an existing cash session."""
@@ -26,6 +31,8 @@ class CloseSessionRequest(BaseModel):
 class SessionData(BaseModel):
     """Data structure for a cash session."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=False)
+
     id: int
     status: str
     opening_balance: Decimal
@@ -64,6 +71,9 @@ class SessionListResponse(BaseModel):
 
 class OpenSessionInfo(BaseModel):
     """Info about an open session at a counter."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=False)
+
     session_id: int
     external_user_id: str
     external_user_name: str
@@ -71,6 +81,8 @@ class OpenSessionInfo(BaseModel):
 class CounterData(BaseModel):
     """Data structure for a cash counter."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=False)
+
     id: int
     name: str
     x_care_id: str
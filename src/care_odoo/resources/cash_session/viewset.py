@@ -1,9 +1,11 @@
 import logging
 
+from pydantic import TypeAdapter
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.response import Response
+from rest_framework.throttling import UserRateThrottle
 
 from care.emr.models import FacilityLocation
 from care.facility.models import Facility
@@ -12,15 +14,36 @@ from care.utils.shortcuts import get_object_or_404
 
 from care_odoo.connector.connector import OdooConnector
 from care.emr.api.viewsets.base import EMRBaseViewSet
+from care_odoo.resources.cash_session.cache import (
+    get_counters,
+    get_current_session,
+    invalidate_session_cache,
+)
 from care_odoo.resources.cash_session.spec import (
     CloseSessionRequest,
     CounterData,
+    OpenSessionInfo,
     OpenSessionRequest,
     SessionData,
 )
+from care_odoo.settings import plugin_settings
+from care_odoo.tasks import _cache_is_shared, warm_cash_session_cache
 
 logger = logging.getLogger(__name__)
 
+# Validate and dump whole Odoo result lists in a single pydantic-core pass
+_SESSION_LIST_ADAPTER = TypeAdapter(list[SessionData])
+_COUNTER_LIST_ADAPTER = TypeAdapter(list[CounterData])
+
+
+class CashSessionPrefetchThrottle(UserRateThrottle):
+    """Limit how often a user can queue Odoo cache warming from the prefetch endpoint."""
+
+    scope = "care_odoo_cash_prefetch"
+
+    def get_rate(self):
+        return plugin_settings.CARE_ODOO_PREFETCH_THROTTLE_RATE
+
 
 class CashSessionViewSet(EMRBaseViewSet):
     """
@@ -36,25 +59,36 @@ class CashSessionViewSet(EMRBaseViewSet):
     - GET /current/ - Get current session for authenticated user at location
     - GET / - List sessions
     - GET /counters/ - List all counters with session status
+    - POST /prefetch/ - Warm the counters and current session caches in the background
     """
 
     def get_facility_obj(self) -> Facility:
-        """Get facility from URL kwargs."""
-        return get_object_or_404(Facility, external_id=self.kwargs["facility_external_id"])
-
-    def get_location_obj(self, location_external_id: str) -> FacilityLocation:
-        """Get location by external ID within the facility."""
-        facility = self.get_facility_obj()
-        try:
-            location = FacilityLocation.objects.get(external_id=location_external_id, facility=facility)
-            return location
-        except FacilityLocation.DoesNotExist:
-            raise NotFound(f"Location {location_external_id} not found in this facility")
+        """Get facility from URL kwargs, fetched once per request."""
+        if not hasattr(self, "_facility"):
+            self._facility = get_object_or_404(Facility, external_id=self.kwargs["facility_external_id"])
+        return self._facility
+
+    def get_location_obj(self, location_external_id: str, facility: Facility | None = None) -> FacilityLocation:
+        """Get location by external ID within the facility, fetched once per request."""
+        if not hasattr(self, "_location_cache"):
+            self._location_cache = {}
+        if location_external_id not in self._location_cache:
+            facility = facility or self.get_facility_obj()
+            try:
+                # Join the single-valued relations walked by the authorization check
+                self._location_cache[location_external_id] = FacilityLocation.objects.select_related(
+                    "facility", "parent"
+                ).get(external_id=location_external_id, facility=facility)
+            except FacilityLocation.DoesNotExist:
+                raise NotFound(f"Location {location_external_id} not found in this facility")
+        return self._location_cache[location_external_id]
 
     def validate_location_access(self, location_external_id: str) -> FacilityLocation:
         """
         Validate that the authenticated user has access to the location.
 
+        The authorization result is cached per (user, location) for the request.
+
         Returns:
             FacilityLocation object if access is granted
 
@@ -63,20 +97,53 @@ class CashSessionViewSet(EMRBaseViewSet):
             PermissionDenied: If user doesn't have access
         """
         facility = self.get_facility_obj()
-        location = self.get_location_obj(location_external_id)
+        location = self.get_location_obj(location_external_id, facility=facility)
+        self._check_location_access(facility, location)
+        return location
 
-        if not AuthorizationController.call("can_list_facility_location_obj", self.request.user, facility, location):
+    def _check_location_access(self, facility: Facility, location: FacilityLocation) -> None:
+        """Raise PermissionDenied unless the user can access the location, caching the result on the request."""
+        # Stored on the request so the result is shared by every view handling it
+        access_cache = self.request._care_odoo_access_cache = getattr(
+            self.request, "_care_odoo_access_cache", {}
+        )
+        key = (self.request.user.id, location.id)
+        if key not in access_cache:
+            access_cache[key] = AuthorizationController.call(
+                "can_list_facility_location_obj", self.request.user, facility, location
+            )
+        if not access_cache[key]:
             raise PermissionDenied(f"You do not have access to location {location.name}")
 
-        return location
-
     def _serialize_session(self, session_data: dict) -> dict:
         """Serialize session data from Odoo response."""
-        return SessionData(**session_data).model_dump()
+        if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+            # Skip validation but still dump through the model so only its fields are returned
+            return SessionData.model_construct(**session_data).model_dump()
+        return SessionData.model_validate(session_data).model_dump()
+
+    def _serialize_sessions(self, sessions: list[dict]) -> list[dict]:
+        """Serialize a list of session data from Odoo response."""
+        if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+            return [SessionData.model_construct(**session).model_dump() for session in sessions]
+        return _SESSION_LIST_ADAPTER.dump_python(_SESSION_LIST_ADAPTER.validate_python(sessions))
+
+    def _construct_counter(self, counter_data: dict) -> CounterData:
+        """Build a CounterData without validation, constructing the nested open sessions too."""
+        open_sessions = [OpenSessionInfo.model_construct(**info) for info in counter_data.get("open_sessions") or []]
+        return CounterData.model_construct(**{**counter_data, "open_sessions": open_sessions})
 
     def _serialize_counter(self, counter_data: dict) -> dict:
         """Serialize counter data from Odoo response."""
-        return CounterData(**counter_data).model_dump()
+        if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+            return self._construct_counter(counter_data).model_dump()
+        return CounterData.model_validate(counter_data).model_dump()
+
+    def _serialize_counters(self, counters: list[dict]) -> list[dict]:
+        """Serialize a list of counter data from Odoo response."""
+        if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+            return [self._construct_counter(counter).model_dump() for counter in counters]
+        return _COUNTER_LIST_ADAPTER.dump_python(_COUNTER_LIST_ADAPTER.validate_python(counters))
 
     def create(self, request, facility_external_id=None):
         """
@@ -89,20 +156,23 @@ class CashSessionViewSet(EMRBaseViewSet):
         }
         """
         try:
-            request_data = OpenSessionRequest(**request.data)
+            request_data = OpenSessionRequest.model_validate(request.data)
         except Exception as e:
             raise ValidationError(f"Invalid request data: {str(e)}") from e
 
+        # JSON-ready values (Decimal opening balance as a number) for the Odoo payload
+        request_json = request_data.model_dump(mode="json")
         user = request.user
+        user_external_id = str(user.external_id)
         facility = self.get_facility_obj()
         location = self.validate_location_access(request_data.counter_x_care_id)
 
         # Build payload for Odoo
         data = {
-            "external_user_id": str(user.external_id),
+            "external_user_id": user_external_id,
             "external_user_name": user.full_name,
             "counter_x_care_id": str(location.external_id),
-            "opening_balance": request_data.opening_balance,
+            "opening_balance": request_json["opening_balance"],
         }
 
         logger.info(
@@ -118,6 +188,8 @@ class CashSessionViewSet(EMRBaseViewSet):
             if not response.get("success", False):
                 raise ValidationError(response.get("message", "Failed to open session in Odoo"))
 
+            invalidate_session_cache(user_external_id, str(location.external_id))
+
             return Response(
                 {
                     "success": True,
@@ -144,20 +216,21 @@ class CashSessionViewSet(EMRBaseViewSet):
         }
         """
         try:
-            request_data = CloseSessionRequest(**request.data)
+            request_data = CloseSessionRequest.model_validate(request.data)
         except Exception as e:
             raise ValidationError(f"Invalid request data: {str(e)}") from e
 
         user = request.user
+        user_external_id = str(user.external_id)
         facility = self.get_facility_obj()
         location = self.validate_location_access(request_data.counter_x_care_id)
 
         # Build payload for Odoo
         data = {
-            "external_user_id": str(user.external_id),
+            "external_user_id": user_external_id,
             "facility_external_id": str(facility.external_id),
             "counter_x_care_id": str(location.external_id),
-            "closed_by_ext_id": str(user.external_id),
+            "closed_by_ext_id": user_external_id,
             "closed_by_name": user.full_name,
         }
 
@@ -174,6 +247,8 @@ class CashSessionViewSet(EMRBaseViewSet):
             if not response.get("success", False):
                 raise ValidationError(response.get("message", "Failed to close session in Odoo"))
 
+            invalidate_session_cache(user_external_id, str(location.external_id))
+
             return Response(
                 {
                     "success": True,
@@ -219,7 +294,7 @@ class CashSessionViewSet(EMRBaseViewSet):
         )
 
         try:
-            response = OdooConnector.call_api("api/care/cash/session/current", data, "POST")
+            response = get_current_session(data["external_user_id"], data["counter_x_care_id"])
 
             session_data = response.get("session")
             if session_data:
@@ -235,6 +310,8 @@ class CashSessionViewSet(EMRBaseViewSet):
                     {"success": True, "session": None, "message": "No open session"},
                     status=status.HTTP_200_OK,
                 )
+        except ValidationError:
+            raise
         except Exception as e:
             logger.exception("Error getting current cash session: %s", str(e))
             raise ValidationError(f"Error getting current cash session: {str(e)}") from e
@@ -243,7 +320,7 @@ class CashSessionViewSet(EMRBaseViewSet):
         """
         List all sessions in the facility, optionally filtered by status.
 
-        GET /facility/{facility_external_id}/cash-session/?status=open
+        GET /facility/{facility_external_id}/cash-session/?status=open&page=1&page_size=20
         """
         facility = self.get_facility_obj()
         session_status = request.query_params.get("status")
@@ -255,22 +332,25 @@ class CashSessionViewSet(EMRBaseViewSet):
         if session_status:
             query_params["status"] = session_status
 
-        logger.info("Listing cash sessions for facility %s: %s", facility.name, query_params)
+        # Forward pagination so Odoo returns a bounded page instead of every row
+        for param in ("page", "page_size"):
+            if request.query_params.get(param):
+                query_params[param] = request.query_params[param]
 
-        # Convert query_params to URL parameters
-        url_params = "&".join([f"{key}={value}" for key, value in query_params.items()])
-        api_url = f"api/care/cash/session/list?{url_params}"
+        logger.info("Listing cash sessions for facility %s: %s", facility.name, query_params)
 
         try:
-            response = OdooConnector.call_api(api_url, {}, "GET")
+            response = OdooConnector.call_api("api/care/cash/session/list", {}, "GET", params=query_params)
 
             sessions = response.get("sessions", [])
-            serialized_sessions = [self._serialize_session(session) for session in sessions]
+            serialized_sessions = self._serialize_sessions(sessions)
 
             return Response(
                 {"success": True, "sessions": serialized_sessions},
                 status=status.HTTP_200_OK,
             )
+        except ValidationError:
+            raise
         except Exception as e:
             logger.exception("Error listing cash sessions: %s", str(e))
             raise ValidationError(f"Error listing cash sessions: {str(e)}") from e
@@ -287,10 +367,10 @@ class CashSessionViewSet(EMRBaseViewSet):
         logger.info("Listing cash counters for facility %s", facility.name)
 
         try:
-            response = OdooConnector.call_api("api/care/cash/counters", {}, "GET")
+            response = get_counters()
 
             counters = response.get("counters", [])
-            serialized_counters = [self._serialize_counter(counter) for counter in counters]
+            serialized_counters = self._serialize_counters(counters)
 
             return Response(
                 {
@@ -300,6 +380,39 @@ class CashSessionViewSet(EMRBaseViewSet):
                 },
                 status=status.HTTP_200_OK,
             )
+        except ValidationError:
+            raise
         except Exception as e:
             logger.exception("Error listing cash counters: %s", str(e))
             raise ValidationError(f"Error listing cash counters: {str(e)}") from e
+
+    @action(detail=False, methods=["post"], url_path="prefetch", throttle_classes=[CashSessionPrefetchThrottle])
+    def prefetch(self, request, facility_external_id=None):
+        """
+        Warm the counters (and optionally the current session) caches in the background.
+
+        Called when the billing dashboard is opened so the follow-up `counters/` and
+        `current/` requests are cache hits. When the cache is not shared with the Celery
+        workers, the warmed entries would never reach this process, so nothing is queued
+        and 204 is returned instead.
+
+        POST /facility/{facility_external_id}/cash-session/prefetch/
+        {
+            "counter_x_care_id": "UUID"  # Optional
+        }
+        """
+        facility = self.get_facility_obj()
+        counter_x_care_id = request.data.get("counter_x_care_id")
+
+        user_external_id = None
+        if counter_x_care_id:
+            location = self.validate_location_access(counter_x_care_id)
+            counter_x_care_id = str(location.external_id)
+            user_external_id = str(request.user.external_id)
+
+        if not _cache_is_shared():
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        warm_cash_session_cache.delay(str(facility.external_id), user_external_id, counter_x_care_id)
+
+        return Response({"success": True}, status=status.HTTP_202_ACCEPTED)
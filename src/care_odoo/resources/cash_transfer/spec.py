@@ -1,7 +1,7 @@
 from decimal import Decimal
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class TransferStatus(str, Enum):
@@ -23,6 +23,11 @@ class CreateTransferRequest(BaseModel):
         default=None, description="Required for main cash transfers"
     )
 
+    @field_serializer("amount", when_used="json")
+    def serialize_amount(self, amount: Decimal) -> float:
+        """Dump amount as a JSON number."""
+        return float(amount)
+
 
 class AcceptTransferRequest(BaseModel):
     """Request to accept a cash transfer."""
@@ -49,6 +54,8 @@ class CancelTransferRequest(BaseModel):
 class TransferData(BaseModel):
     """Data structure for a cash transfer."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=False)
+
     id: int
     status: str
     amount: Decimal
@@ -1,5 +1,6 @@
 import logging
 
+from pydantic import TypeAdapter
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
@@ -19,9 +20,13 @@ from care_odoo.resources.cash_transfer.spec import (
     RejectTransferRequest,
     TransferData,
 )
+from care_odoo.settings import plugin_settings
 
 logger = logging.getLogger(__name__)
 
+# Validate and dump whole Odoo result lists in a single pydantic-core pass
+_TRANSFER_LIST_ADAPTER = TypeAdapter(list[TransferData])
+
 
 class CashTransferViewSet(EMRBaseViewSet):
     """
@@ -41,22 +46,32 @@ class CashTransferViewSet(EMRBaseViewSet):
     """
 
     def get_facility_obj(self) -> Facility:
-        """Get facility from URL kwargs."""
-        return get_object_or_404(Facility, external_id=self.kwargs["facility_external_id"])
-
-    def get_location_obj(self, location_external_id: str) -> FacilityLocation:
-        """Get location by external ID within the facility."""
-        facility = self.get_facility_obj()
-        try:
-            location = FacilityLocation.objects.get(external_id=location_external_id, facility=facility)
-            return location
-        except FacilityLocation.DoesNotExist:
-            raise NotFound(f"Location {location_external_id} not found in this facility")
+        """Get facility from URL kwargs, fetched once per request."""
+        if not hasattr(self, "_facility"):
+            self._facility = get_object_or_404(Facility, external_id=self.kwargs["facility_external_id"])
+        return self._facility
+
+    def get_location_obj(self, location_external_id: str, facility: Facility | None = None) -> FacilityLocation:
+        """Get location by external ID within the facility, fetched once per request."""
+        if not hasattr(self, "_location_cache"):
+            self._location_cache = {}
+        if location_external_id not in self._location_cache:
+            facility = facility or self.get_facility_obj()
+            try:
+                # Join the single-valued relations walked by the authorization check
+                self._location_cache[location_external_id] = FacilityLocation.objects.select_related(
+                    "facility", "parent"
+                ).get(external_id=location_external_id, facility=facility)
+            except FacilityLocation.DoesNotExist:
+                raise NotFound(f"Location {location_external_id} not found in this facility")
+        return self._location_cache[location_external_id]
 
     def validate_location_access(self, location_external_id: str) -> FacilityLocation:
         """
         Validate that the authenticated user has access to the location.
 
+        The authorization result is cached per (user, location) for the request.
+
         Returns:
             FacilityLocation object if access is granted
 
@@ -65,16 +80,36 @@ class CashTransferViewSet(EMRBaseViewSet):
             PermissionDenied: If user doesn't have access
         """
         facility = self.get_facility_obj()
-        location = self.get_location_obj(location_external_id)
+        location = self.get_location_obj(location_external_id, facility=facility)
+        self._check_location_access(facility, location)
+        return location
 
-        if not AuthorizationController.call("can_list_facility_location_obj", self.request.user, facility, location):
+    def _check_location_access(self, facility: Facility, location: FacilityLocation) -> None:
+        """Raise PermissionDenied unless the user can access the location, caching the result on the request."""
+        # Stored on the request so the result is shared by every view handling it
+        access_cache = self.request._care_odoo_access_cache = getattr(
+            self.request, "_care_odoo_access_cache", {}
+        )
+        key = (self.request.user.id, location.id)
+        if key not in access_cache:
+            access_cache[key] = AuthorizationController.call(
+                "can_list_facility_location_obj", self.request.user, facility, location
+            )
+        if not access_cache[key]:
             raise PermissionDenied(f"You do not have access to location {location.name}")
 
-        return location
-
     def _serialize_transfer(self, transfer_data: dict) -> dict:
         """Serialize transfer data from Odoo response."""
-        return TransferData(**transfer_data).model_dump()
+        if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+            # Skip validation but still dump through the model so only its fields are returned
+            return TransferData.model_construct(**transfer_data).model_dump()
+        return TransferData.model_validate(transfer_data).model_dump()
+
+    def _serialize_transfers(self, transfers: list[dict]) -> list[dict]:
+        """Serialize a list of transfer data from Odoo response."""
+        if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+            return [TransferData.model_construct(**transfer).model_dump() for transfer in transfers]
+        return _TRANSFER_LIST_ADAPTER.dump_python(_TRANSFER_LIST_ADAPTER.validate_python(transfers))
 
     def list(self, request, facility_external_id=None):
         """
@@ -87,6 +122,7 @@ class CashTransferViewSet(EMRBaseViewSet):
         - counter_x_care_id: Filter by counter (shows transfers to/from this counter)
         - from_session_id: Filter by the originating session ID
         - to_session_id: Filter by the destination session ID
+        - page, page_size: Pagination, forwarded to Odoo
         """
         facility = self.get_facility_obj()
         transfer_status = request.query_params.get("status")
@@ -112,9 +148,10 @@ class CashTransferViewSet(EMRBaseViewSet):
         if to_session_id:
             query_params["to_session_id"] = to_session_id
 
-        # Convert query_params to URL parameters
-        url_params = "&".join([f"{key}={value}" for key, value in query_params.items()])
-        api_url = f"api/care/cash/transfer/list?{url_params}"
+        # Forward pagination so Odoo returns a bounded page instead of every row
+        for param in ("page", "page_size"):
+            if request.query_params.get(param):
+                query_params[param] = request.query_params[param]
 
         logger.info(
             "Listing cash transfers for facility %s: %s",
@@ -123,15 +160,17 @@ class CashTransferViewSet(EMRBaseViewSet):
         )
 
         try:
-            response = OdooConnector.call_api(api_url, {}, "GET")
+            response = OdooConnector.call_api("api/care/cash/transfer/list", {}, "GET", params=query_params)
 
             transfers = response.get("transfers", [])
-            serialized_transfers = [self._serialize_transfer(transfer) for transfer in transfers]
+            serialized_transfers = self._serialize_transfers(transfers)
 
             return Response(
                 {"success": True, "transfers": serialized_transfers},
                 status=status.HTTP_200_OK,
             )
+        except ValidationError:
+            raise
         except Exception as e:
             logger.exception("Error listing cash transfers: %s", str(e))
             raise ValidationError(f"Error listing cash transfers: {str(e)}") from e
@@ -149,23 +188,26 @@ class CashTransferViewSet(EMRBaseViewSet):
         }
         """
         try:
-            request_data = CreateTransferRequest(**request.data)
+            request_data = CreateTransferRequest.model_validate(request.data)
         except Exception as e:
             raise ValidationError(f"Invalid request data: {str(e)}") from e
 
+        # JSON-ready values (Decimal amount as a number) for the Odoo payload
+        request_json = request_data.model_dump(mode="json")
         user = request.user
+        user_external_id = str(user.external_id)
         facility = self.get_facility_obj()
         from_location = self.validate_location_access(request_data.from_counter_x_care_id)
         # Build payload for Odoo
         data = {
-            "from_user_id": str(user.external_id),
+            "from_user_id": user_external_id,
             "facility_external_id": str(facility.external_id),
             "from_counter_x_care_id": str(from_location.external_id),
             "to_session_id": request_data.to_session_id,
-            "amount": request_data.amount,
-            "created_by_ext_id": str(user.external_id),
+            "amount": request_json["amount"],
+            "created_by_ext_id": user_external_id,
             "created_by_name": user.full_name,
-            "denominations": request_data.denominations,
+            "denominations": request_json["denominations"],
         }
 
         logger.info(
@@ -209,7 +251,7 @@ class CashTransferViewSet(EMRBaseViewSet):
             raise ValidationError("Transfer ID is required")
 
         try:
-            request_data = AcceptTransferRequest(**request.data)
+            request_data = AcceptTransferRequest.model_validate(request.data)
         except Exception as e:
             raise ValidationError(f"Invalid request data: {str(e)}") from e
 
@@ -272,7 +314,7 @@ class CashTransferViewSet(EMRBaseViewSet):
             raise ValidationError("Transfer ID is required")
 
         try:
-            request_data = RejectTransferRequest(**request.data)
+            request_data = RejectTransferRequest.model_validate(request.data)
         except Exception as e:
             raise ValidationError(f"Invalid request data: {str(e)}") from e
 
@@ -335,7 +377,7 @@ class CashTransferViewSet(EMRBaseViewSet):
             raise ValidationError("Transfer ID is required")
 
         try:
-            request_data = CancelTransferRequest(**request.data)
+            request_data = CancelTransferRequest.model_validate(request.data)
         except Exception as e:
             raise ValidationError(f"Invalid request data: {str(e)}") from e
 
@@ -417,12 +459,14 @@ class CashTransferViewSet(EMRBaseViewSet):
             response = OdooConnector.call_api("api/care/cash/transfer/pending/", query_params, "POST")
 
             transfers = response.get("transfers", [])
-            serialized_transfers = [self._serialize_transfer(transfer) for transfer in transfers]
+            serialized_transfers = self._serialize_transfers(transfers)
 
             return Response(
                 {"success": True, "transfers": serialized_transfers},
                 status=status.HTTP_200_OK,
             )
+        except ValidationError:
+            raise
         except Exception as e:
             logger.exception("Error getting pending transfers: %s", str(e))
             raise ValidationError(f"Error getting pending transfers: {str(e)}") from e
@@ -0,0 +1,38 @@
+"""
+Short-lived caching of Odoo payment method line reads.
+
+Payment method lines are reference data that changes rarely in Odoo, while the
+payment UI fetches them on every form load, so reads are cached for a minute.
+"""
+
+from django.core.cache import cache
+
+from care_odoo.connector.connector import OdooConnector
+
+PAYMENT_METHOD_LINES_CACHE_TIMEOUT = 60
+
+
+def payment_method_lines_cache_key(journal_type: str) -> str:
+    return f"odoo:payment_method_lines:{journal_type}"
+
+
+def payment_method_line_cache_key(pk: str) -> str:
+    return f"odoo:payment_method_line:{pk}"
+
+
+def get_payment_method_lines(query_params: dict) -> dict:
+    """Return the Odoo payment method lines response, served from cache when available."""
+    return cache.get_or_set(
+        payment_method_lines_cache_key(query_params["journal_type"]),
+        lambda: OdooConnector.call_api("api/payment/method/lines", query_params, "GET"),
+        timeout=PAYMENT_METHOD_LINES_CACHE_TIMEOUT,
+    )
+
+
+def get_payment_method_line(pk: str) -> dict:
+    """Return the Odoo response for a single payment method line, served from cache when available."""
+    return cache.get_or_set(
+        payment_method_line_cache_key(pk),
+        lambda: OdooConnector.call_api(f"api/payment/method/lines/{pk}", {}, "GET"),
+        timeout=PAYMENT_METHOD_LINES_CACHE_TIMEOUT,
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PaymentMethodLineData(BaseModel):
@@ -11,6 +11,8 @@ class PaymentMethodLineData(BaseModel):
     Each payment method line is tied to a specific journal (e.g., Charity Journal).
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=False)
+
     id: int
     name: str
     code: str | None = None
@@ -1,9 +1,17 @@
+from django.http import HttpResponse
+from pydantic import TypeAdapter
 from rest_framework.exceptions import ValidationError
-from rest_framework.response import Response
 
 from care.emr.api.viewsets.base import EMRBaseViewSet
-from care_odoo.connector.connector import OdooConnector
+from care_odoo.resources.payment_method_line.cache import (
+    get_payment_method_line,
+    get_payment_method_lines,
+)
 from care_odoo.resources.payment_method_line.spec import PaymentMethodLineData
+from care_odoo.settings import plugin_settings
+
+# Validate and dump whole Odoo result lists in a single pydantic-core pass
+_PAYMENT_METHOD_LINE_LIST_ADAPTER = TypeAdapter(list[PaymentMethodLineData])
 
 
 class PaymentMethodLineViewSet(EMRBaseViewSet):
@@ -28,6 +36,12 @@ class PaymentMethodLineViewSet(EMRBaseViewSet):
 
         return query_params
 
+    def _build_payment_method_line(self, payment_method: dict) -> PaymentMethodLineData:
+        """Build a PaymentMethodLineData, skipping validation when Odoo responses are trusted."""
+        if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+            return PaymentMethodLineData.model_construct(**payment_method)
+        return PaymentMethodLineData.model_validate(payment_method)
+
     def list(self, request):
         """
         List payment method lines from Odoo filtered by journal type.
@@ -43,22 +57,19 @@ class PaymentMethodLineViewSet(EMRBaseViewSet):
 
         try:
             # Call Odoo API to list payment method lines
-            response = OdooConnector.call_api(
-                "api/payment/method/lines",
-                query_params,
-                "GET",
-            )
+            response = get_payment_method_lines(query_params)
 
             # Extract payment methods from response
             payment_methods = response.get("payment_methods", [])
 
-            # Serialize using PaymentMethodLineData spec
-            serialized_payment_methods = []
-            for pm in payment_methods:
-                payment_method_data = PaymentMethodLineData(**pm)
-                serialized_payment_methods.append(payment_method_data.model_dump())
+            # Serialize straight to JSON bytes using PaymentMethodLineData spec, skipping DRF's re-encode
+            if plugin_settings.CARE_ODOO_TRUST_RESPONSE:
+                payment_method_lines = [self._build_payment_method_line(pm) for pm in payment_methods]
+            else:
+                payment_method_lines = _PAYMENT_METHOD_LINE_LIST_ADAPTER.validate_python(payment_methods)
+            serialized_payment_methods = _PAYMENT_METHOD_LINE_LIST_ADAPTER.dump_json(payment_method_lines)
 
-            return Response(serialized_payment_methods)
+            return HttpResponse(serialized_payment_methods, content_type="application/json")
 
         except Exception as e:
             raise ValidationError(
@@ -76,16 +87,12 @@ class PaymentMethodLineViewSet(EMRBaseViewSet):
             Payment method line details
         """
         try:
-            response = OdooConnector.call_api(
-                f"api/payment/method/lines/{pk}",
-                {},
-                "GET",
-            )
+            response = get_payment_method_line(pk)
 
             payment_method = response.get("payment_method", {})
-            payment_method_data = PaymentMethodLineData(**payment_method)
+            payment_method_data = self._build_payment_method_line(payment_method)
 
-            return Response(payment_method_data.model_dump())
+            return HttpResponse(payment_method_data.model_dump_json(), content_type="application/json")
 
         except Exception as e:
             raise ValidationError(
@@ -1,13 +1,16 @@
+import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
 from care.emr.models.product import Product
+from django.db.models import QuerySet
 
 from care_odoo.connector.connector import OdooConnector
 from care_odoo.resources.product_category.spec import CategoryData
 from care_odoo.resources.product_product.spec import ProductData, TaxData
-from care_odoo.resources.utils import (
-    get_base_price_from_definition,
-    get_purchase_price_from_definition,
-    get_taxes_from_definition,
-)
+from care_odoo.resources.utils import classify_price_components
+
+logger = logging.getLogger(__name__)
 
 
 class OdooProductProductResource:
@@ -21,37 +24,45 @@ class OdooProductProductResource:
         Returns:
             Odoo product ID if successful, None otherwise
         """
-        base_price = get_base_price_from_definition(charge_item_definition)
-        purchase_price = get_purchase_price_from_definition(charge_item_definition)
+        data = self._build_product_data(charge_item_definition, hsn)
+        return self._post_product(data)
+
+    def _post_product(self, data: dict) -> int | None:
+        """Send a product payload to Odoo and return the Odoo product ID."""
+        response = OdooConnector.call_api("api/add/product", data)
+        return response.get("product", {}).get("id")
+
+    def _build_product_data(self, charge_item_definition, hsn: str = "") -> dict:
+        """Build the Odoo product payload for a charge item definition."""
+        price_components = classify_price_components(charge_item_definition.price_components)
+        base_price = price_components["base"]
+        purchase_price = price_components["purchase_price"]
 
         taxes = []
-        for tax in get_taxes_from_definition(charge_item_definition):
+        for tax in price_components["taxes"]:
             taxes.append(
                 TaxData(
                     tax_name=tax["code"]["display"],
                     tax_percentage=float(tax["factor"]),
                 )
             )
-        data = ProductData(
+        category = charge_item_definition.category
+        parent = category.parent
+        return ProductData(
             product_name=f"{charge_item_definition.title}",
             x_care_id=str(charge_item_definition.external_id),
             mrp=float(base_price),
             cost=float(purchase_price),
             category=CategoryData(
-                category_name=charge_item_definition.category.title,
-                parent_x_care_id=str(charge_item_definition.category.parent.external_id)
-                if charge_item_definition.category.parent
-                else "",
-                x_care_id=str(charge_item_definition.category.external_id),
+                category_name=category.title,
+                parent_x_care_id=str(parent.external_id) if parent else "",
+                x_care_id=str(category.external_id),
             ),
             taxes=taxes,
             hsn=hsn,
             status=charge_item_definition.status,
         ).model_dump()
 
-        response = OdooConnector.call_api("api/add/product", data)
-        return response.get("product", {}).get("id")
-
     def sync_product_from_product_model(self, product: Product) -> int | None:
         """
         Synchronize a product to Odoo if it has a charge item definition.
@@ -65,10 +76,60 @@ class OdooProductProductResource:
         if not product.charge_item_definition:
             return None
 
-        hsn = (
+        return self.sync_product_to_odoo_api(product.charge_item_definition, self._get_hsn(product))
+
+    def _get_hsn(self, product: Product) -> str:
+        """Get the HSN code for a product from its product knowledge."""
+        return (
             product.product_knowledge.alternate_identifier
             if product.product_knowledge and product.product_knowledge.alternate_identifier
             else ""
         )
 
-        return self.sync_product_to_odoo_api(product.charge_item_definition, hsn)
+    def sync_products_bulk(self, products: Iterable[Product], max_workers: int = 8) -> list[int | None]:
+        """
+        Synchronize many products to Odoo, overlapping the Odoo round trips.
+
+        Payloads are built up front on the calling thread, so only the HTTP calls run on
+        the thread pool and no worker touches the database. A failing product is logged
+        and does not abort the rest.
+
+        Args:
+            products: Product instances or a Product queryset
+            max_workers: Maximum number of concurrent Odoo calls
+
+        Returns:
+            One entry per input, in order: the Odoo product ID, or None if the product has
+            no charge item definition or failed to sync
+        """
+        if isinstance(products, QuerySet):
+            products = products.select_related(
+                "product_knowledge",
+                "charge_item_definition__category__parent",
+            )
+        products = list(products)
+
+        payloads: list[dict | None] = []
+        for product in products:
+            if not product.charge_item_definition:
+                payloads.append(None)
+                continue
+            try:
+                payloads.append(self._build_product_data(product.charge_item_definition, self._get_hsn(product)))
+            except Exception as e:
+                logger.exception("Failed to build Odoo payload for product %s: %s", product.external_id, str(e))
+                payloads.append(None)
+
+        results: list[int | None] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._post_product, data) if data is not None else None for data in payloads]
+            for product, future in zip(products, futures, strict=True):
+                if future is None:
+                    results.append(None)
+                    continue
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.exception("Failed to sync product %s to Odoo: %s", product.external_id, str(e))
+                    results.append(None)
+        return results
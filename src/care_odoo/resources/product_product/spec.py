@@ -1,7 +1,7 @@
 from decimal import Decimal
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from care_odoo.resources.product_category.spec import CategoryData
 
@@ -18,6 +18,9 @@ class ProductStatus(str, Enum):
 
 
 class ProductData(BaseModel):
+    # Store enum members as their string values so dumps skip enum serialization
+    model_config = ConfigDict(use_enum_values=True)
+
     product_name: str
     x_care_id: str
     cost: Decimal
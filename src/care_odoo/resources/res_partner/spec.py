@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PartnerType(str, Enum):
@@ -15,6 +15,9 @@ class PartnerStatus(str, Enum):
 
 
 class PartnerData(BaseModel):
+    # Store enum members as their string values so dumps skip enum serialization
+    model_config = ConfigDict(use_enum_values=True)
+
     name: str
     x_care_id: str
     email: str
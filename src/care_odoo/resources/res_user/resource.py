@@ -6,9 +6,8 @@ from care_odoo.resources.res_user.spec import UserData, UserType
 
 class OdooUserResource:
     def get_full_name(self, user: User):
-        name = [user.prefix, user.first_name, user.last_name, user.suffix]
-        name = " ".join(filter(None, [x.strip() if x else None for x in name]))
-        return name or user.username or "-"
+        parts = (x.strip() for x in (user.prefix, user.first_name, user.last_name, user.suffix) if x and x.strip())
+        return " ".join(parts) or user.username or "-"
 
     def sync_user_to_odoo_api(self, user) -> int | None:
         """
@@ -20,9 +19,11 @@ class OdooUserResource:
         Returns:
             Odoo user ID if successful, None otherwise
         """
+        full_name = self.get_full_name(user)
+
         # Create partner data first
         partner_data = PartnerData(
-            name=self.get_full_name(user),
+            name=full_name,
             x_care_id=str(user.external_id),
             partner_type=PartnerType.person,
             phone=user.phone_number,
@@ -35,7 +36,7 @@ class OdooUserResource:
         # Create user data
         data = UserData(
             x_care_id=str(user.external_id),
-            name=self.get_full_name(user),
+            name=full_name,
             login=user.username,
             email=user.email,
             user_type=UserType.public,
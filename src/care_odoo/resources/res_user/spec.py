@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from care_odoo.resources.res_partner.spec import PartnerData
 
@@ -12,6 +12,9 @@ class UserType(str, Enum):
 
 
 class UserData(BaseModel):
+    # Store enum members as their string values so dumps skip enum serialization
+    model_config = ConfigDict(use_enum_values=True)
+
     x_care_id: str
     name: str
     login: str
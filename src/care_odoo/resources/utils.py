@@ -18,6 +18,13 @@ from care_odoo.resources.account_move.spec import (
 )
 
 
+# Enum values bound once, compared against on every price component
+_MC_BASE = MonetaryComponentType.base.value
+_MC_INFO = MonetaryComponentType.informational.value
+_MC_TAX = MonetaryComponentType.tax.value
+_MC_DISC = MonetaryComponentType.discount.value
+
+
 def get_base_price_from_components(price_components: list | None) -> str:
     """
     Extract base price from price components.
@@ -31,11 +38,43 @@ def get_base_price_from_components(price_components: list | None) -> str:
     if not price_components:
         return "0"
     for item in price_components:
-        if item.get("monetary_component_type") == MonetaryComponentType.base.value:
+        if item.get("monetary_component_type") == _MC_BASE:
             return item.get("amount", "0")
     return "0"
 
 
+def classify_price_components(price_components: list | None, raise_if_not_found: bool = False) -> dict:
+    """
+    Extract base price, purchase price, MRP and taxes from price components in a single pass.
+
+    Args:
+        price_components: List of price component dictionaries, or None
+        raise_if_not_found: If True, raise ValidationError when base price not found
+
+    Returns:
+        Dict with "base", "purchase_price" and "mrp" as strings ("0" if not found)
+        and "taxes" as a list of tax component dictionaries
+    """
+    components = {"base": None, "purchase_price": None, "mrp": None, "taxes": []}
+    for item in price_components or []:
+        component_type = item.get("monetary_component_type")
+        if component_type == _MC_BASE:
+            if components["base"] is None:
+                components["base"] = item.get("amount", "0")
+        elif component_type == _MC_INFO:
+            code = item.get("code", {}).get("code")
+            if code in ("purchase_price", "mrp") and components[code] is None:
+                components[code] = item.get("amount", "0")
+        elif component_type == _MC_TAX:
+            components["taxes"].append(item)
+    for key in ("base", "purchase_price", "mrp"):
+        if components[key] is None:
+            components[key] = "0"
+    if raise_if_not_found and components["base"] == "0":
+        raise ValidationError("Base price not found")
+    return components
+
+
 def get_base_price_from_charge_item(charge_item: ChargeItem | None, raise_if_not_found: bool = False) -> str:
     """
     Extract base price from charge item's unit price components.
@@ -84,7 +123,7 @@ def get_purchase_price_from_components(price_components: list | None) -> str:
         return "0"
     for item in price_components:
         if (
-            item.get("monetary_component_type") == MonetaryComponentType.informational.value
+            item.get("monetary_component_type") == _MC_INFO
             and item.get("code", {}).get("code") == "purchase_price"
         ):
             return item.get("amount", "0")
@@ -135,7 +174,7 @@ def get_mrp_from_components(price_components: list | None) -> str:
         return "0"
     for item in price_components:
         if (
-            item.get("monetary_component_type") == MonetaryComponentType.informational.value
+            item.get("monetary_component_type") == _MC_INFO
             and item.get("code", {}).get("code") == "mrp"
         ):
             return item.get("amount", "0")
@@ -186,7 +225,7 @@ def get_taxes_from_components(price_components: list | None) -> list:
     if not price_components:
         return taxes
     for item in price_components:
-        if item.get("monetary_component_type") == MonetaryComponentType.tax.value:
+        if item.get("monetary_component_type") == _MC_TAX:
             taxes.append(item)
     return taxes
 
@@ -225,12 +264,18 @@ def get_all_discounts(charge_item: ChargeItem) -> list[InvoiceDiscounts] | None:
     # Find all discounts in unit_price_components
     unit_discounts = []
     for component in charge_item.unit_price_components:
-        if component.get("monetary_component_type") == MonetaryComponentType.discount.value:
+        if component.get("monetary_component_type") == _MC_DISC:
             unit_discounts.append(component)
 
     if not unit_discounts:
         return None
 
+    # Index total discount components by code, keeping the first match per code
+    total_discounts_by_code = {}
+    for component in charge_item.total_price_components or []:
+        if component.get("monetary_component_type") == _MC_DISC:
+            total_discounts_by_code.setdefault(component.get("code", {}).get("code"), component)
+
     discounts = []
     for unit_discount in unit_discounts:
         code = unit_discount.get("code", {})
@@ -249,15 +294,8 @@ def get_all_discounts(charge_item: ChargeItem) -> list[InvoiceDiscounts] | None:
             rate = float(unit_discount.get("amount", 0.0))
 
         # Get discount amount from total_price_components
-        disc_amt = 0.0
-        if charge_item.total_price_components:
-            for component in charge_item.total_price_components:
-                if (
-                    component.get("monetary_component_type") == MonetaryComponentType.discount.value
-                    and component.get("code", {}).get("code") == discount_code
-                ):
-                    disc_amt = float(component.get("amount", 0.0))
-                    break
+        total_discount = total_discounts_by_code.get(discount_code)
+        disc_amt = float(total_discount.get("amount", 0.0)) if total_discount else 0.0
 
         discounts.append(
             InvoiceDiscounts(
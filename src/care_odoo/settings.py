@@ -108,8 +108,15 @@ DEFAULTS = {
     # Delay in seconds before running the cleanup verification task
     # This gives the transaction time to commit or rollback before checking
     "CARE_ODOO_CLEANUP_DELAY_SECONDS": 30,
+    # Celery queue for the cleanup verification tasks, so they can run on a dedicated worker
+    # Leave empty to use the default queue; a worker must consume the queue when it is set
+    "CARE_ODOO_CLEANUP_QUEUE": "",
     "CARE_INSURANCE_TAG_ID": "",
     "CARE_ODOO_INTERNAL_SUPPLIER_ID": "",
+    # Skip pydantic validation of Odoo responses and pass them through without re-checking types
+    "CARE_ODOO_TRUST_RESPONSE": False,
+    # Per-user rate limit for the cash session prefetch endpoint, in DRF throttle rate format
+    "CARE_ODOO_PREFETCH_THROTTLE_RATE": "10/min",
 }
 
 # Required settings for production
@@ -1,6 +1,6 @@
 import logging
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_init, post_save, pre_save
 from django.dispatch import receiver
 
 from care.emr.models.charge_item_definition import ChargeItemDefinition
@@ -34,35 +34,82 @@ from care_odoo.resources.product_product.resource import OdooProductProductResou
 from care_odoo.resources.res_partner.resource import OdooPartnerResource
 from care_odoo.resources.res_user.resource import OdooUserResource
 from care_odoo.settings import plugin_settings
-from care_odoo.tasks import verify_invoice_exists_or_cleanup, verify_payment_exists_or_cleanup
+from care_odoo.tasks import schedule_cleanup_verification
 
 logger = logging.getLogger(__name__)
 
+# Status sets checked on every invoice and payment save
+_INVOICE_SYNC_STATUSES = frozenset({InvoiceStatusOptions.issued.value})
+_INVOICE_CANCELLED_STATUSES = frozenset(INVOICE_CANCELLED_STATUS)
+_INVOICE_SYNCED_STATUSES = frozenset({InvoiceStatusOptions.issued.value, InvoiceStatusOptions.balanced.value})
+_PAYMENT_CANCELLED_STATUSES = frozenset(
+    {
+        PaymentReconciliationStatusOptions.cancelled.value,
+        PaymentReconciliationStatusOptions.entered_in_error.value,
+    }
+)
 
-@receiver(post_save, sender=User)
+# The resources hold no per-call state, so one instance of each is shared by all handlers
+_odoo_user = OdooUserResource()
+_odoo_invoice = OdooInvoiceResource()
+_odoo_payment = OdooPaymentResource()
+_odoo_product = OdooProductProductResource()
+_odoo_category = OdooCategoryResource()
+_odoo_partner = OdooPartnerResource()
+_odoo_delivery_order = OdooDeliveryOrderResource()
+
+
+@receiver(post_save, sender=User, dispatch_uid="care_odoo.sync_user_to_odoo")
 def sync_user_to_odoo(sender, instance, created, **kwargs):
     """
     Signal handler to sync user to Odoo when created or updated.
     """
-    odoo_user = OdooUserResource()
-    odoo_user.sync_user_to_odoo_api(instance)
+    _odoo_user.sync_user_to_odoo_api(instance)
+
+
+def _remember_status(instance):
+    """Record the status and locked values the instance currently holds for the database row."""
+    # Read from __dict__ so deferred fields are not loaded just to be remembered
+    instance._loaded_status = instance.__dict__.get("status")
+    instance._loaded_locked = instance.__dict__.get("locked")
+
+
+@receiver(post_init, sender=Invoice, dispatch_uid="care_odoo.remember_loaded_status")
+def remember_loaded_status(sender, instance, **kwargs):
+    """
+    Remember the status and locked values an invoice was loaded with, so pre_save needs no query.
+    """
+    _remember_status(instance)
 
 
-@receiver(pre_save, sender=Invoice)
-def capture_previous_status(sender, instance, **kwargs):
+@receiver(pre_save, sender=Invoice, dispatch_uid="care_odoo.capture_previous_status")
+def capture_previous_status(sender, instance, update_fields=None, **kwargs):
     """
     Capture the previous status and locked values before save to access them in post_save signal.
     """
-    if instance.pk:
-        old_instance = Invoice.objects.get(pk=instance.pk)
-        instance._previous_status = old_instance.status
-        instance._previous_locked = old_instance.locked
-    else:
-        instance._previous_status = None
-        instance._previous_locked = None
+    if update_fields is not None and not {"status", "locked"} & set(update_fields):
+        # Neither column is written by this save, so the stored values stay as they are
+        instance._previous_status, instance._previous_locked = instance.status, instance.locked
+        return
+
+    previous = None
+    if (
+        instance.pk
+        and not instance._state.adding
+        and instance.status not in _INVOICE_SYNC_STATUSES
+        and instance.status not in _INVOICE_CANCELLED_STATUSES
+        and getattr(instance, "_loaded_status", None) is not None
+    ):
+        # The snapshot goes stale after refresh_from_db, queryset updates and concurrent
+        # writes, so it is only trusted for saves that never sync to Odoo
+        previous = (instance._loaded_status, instance._loaded_locked)
+    elif instance.pk:
+        # Only the two compared columns are needed, so skip building a full model instance
+        previous = Invoice.objects.filter(pk=instance.pk).values_list("status", "locked").first()
+    instance._previous_status, instance._previous_locked = previous or (None, None)
 
 
-@receiver(post_save, sender=Invoice)
+@receiver(post_save, sender=Invoice, dispatch_uid="care_odoo.save_fields_before_update")
 def save_fields_before_update(sender, instance, raw, using, update_fields, **kwargs):
     """
     Signal handler to sync invoice to Odoo when status changes.
@@ -87,33 +134,32 @@ def save_fields_before_update(sender, instance, raw, using, update_fields, **kwa
     # Access previous status if needed: getattr(instance, "_previous_status", None)
     # current_status = instance.status
 
-    if instance.status in [
-        InvoiceStatusOptions.issued.value,
-    ]:
+    external_id = str(instance.external_id)
+    if instance.status in _INVOICE_SYNC_STATUSES:
         # Schedule cleanup task to verify invoice exists after transaction completes
         # The task runs after a delay to give the transaction time to commit or rollback
         # If the transaction rolled back, this task will clean up the orphaned Odoo invoice
         cleanup_delay = plugin_settings.CARE_ODOO_CLEANUP_DELAY_SECONDS
-        logger.info(
-            "Scheduling invoice cleanup verification task for %s in %d seconds",
-            instance.external_id,
+        logger.debug(
+            "Scheduling invoice cleanup verification for %s in at least %d seconds",
+            external_id,
             cleanup_delay,
         )
-        verify_invoice_exists_or_cleanup.apply_async(
-            args=[str(instance.external_id)],
-            countdown=cleanup_delay,
-        )
-        odoo_integration = OdooInvoiceResource()
-        odoo_integration.sync_invoice_to_odoo_api(instance.external_id)
-    elif instance.status in INVOICE_CANCELLED_STATUS and instance._previous_status in [
-        InvoiceStatusOptions.issued.value,
-        InvoiceStatusOptions.balanced.value,
-    ]:
-        odoo_integration = OdooInvoiceResource()
-        odoo_integration.sync_invoice_return_to_odoo_api(instance.external_id)
+        schedule_cleanup_verification("invoice", external_id)
+        _odoo_invoice.sync_invoice_to_odoo_api(external_id)
+    elif instance.status in _INVOICE_CANCELLED_STATUSES and instance._previous_status in _INVOICE_SYNCED_STATUSES:
+        _odoo_invoice.sync_invoice_return_to_odoo_api(external_id)
 
 
-@receiver(post_save, sender=PaymentReconciliation)
+@receiver(post_save, sender=Invoice, dispatch_uid="care_odoo.remember_saved_status")
+def remember_saved_status(sender, instance, **kwargs):
+    """
+    Refresh the remembered status and locked values once they have been written.
+    """
+    _remember_status(instance)
+
+
+@receiver(post_save, sender=PaymentReconciliation, dispatch_uid="care_odoo.sync_payment_to_odoo")
 def sync_payment_to_odoo(sender, instance, created, **kwargs):
     """
     Signal handler to sync payment reconciliation to Odoo when created.
@@ -127,61 +173,51 @@ def sync_payment_to_odoo(sender, instance, created, **kwargs):
     if instance.deleted or instance.reconciliation_type == PaymentReconciliationTypeOptions.adjustment.value:
         return
 
+    external_id = str(instance.external_id)
     if instance.status == PaymentReconciliationStatusOptions.active.value:
         # Schedule cleanup task to verify payment exists after transaction completes
         # The task runs after a delay to give the transaction time to commit or rollback
         # If the transaction rolled back, this task will clean up the orphaned Odoo payment
         cleanup_delay = plugin_settings.CARE_ODOO_CLEANUP_DELAY_SECONDS
-        logger.info(
-            "Scheduling payment cleanup verification task for %s in %d seconds",
-            instance.external_id,
+        logger.debug(
+            "Scheduling payment cleanup verification for %s in at least %d seconds",
+            external_id,
             cleanup_delay,
         )
-        verify_payment_exists_or_cleanup.apply_async(
-            args=[str(instance.external_id)],
-            countdown=cleanup_delay,
-        )
+        schedule_cleanup_verification("payment", external_id)
 
-        odoo_payment = OdooPaymentResource()
-        odoo_payment.sync_payment_to_odoo_api(instance.external_id)
-    elif instance.status in [
-        PaymentReconciliationStatusOptions.cancelled.value,
-        PaymentReconciliationStatusOptions.entered_in_error.value,
-    ]:
-        odoo_payment = OdooPaymentResource()
-        odoo_payment.sync_payment_cancel_to_odoo_api(instance.external_id)
+        _odoo_payment.sync_payment_to_odoo_api(external_id)
+    elif instance.status in _PAYMENT_CANCELLED_STATUSES:
+        _odoo_payment.sync_payment_cancel_to_odoo_api(external_id)
 
 
-@receiver(post_save, sender=ChargeItemDefinition)
+@receiver(post_save, sender=ChargeItemDefinition, dispatch_uid="care_odoo.sync_charge_item_definition_to_odoo")
 def sync_charge_item_definition_to_odoo(sender, instance, created, **kwargs):
     """
     Signal handler to sync charge item definition to Odoo as a product when created or updated.
     """
-    odoo_product = OdooProductProductResource()
-    odoo_product.sync_product_to_odoo_api(instance)
+    _odoo_product.sync_product_to_odoo_api(instance)
 
 
-@receiver(post_save, sender=ResourceCategory)
+@receiver(post_save, sender=ResourceCategory, dispatch_uid="care_odoo.sync_resource_category_to_odoo")
 def sync_resource_category_to_odoo(sender, instance, created, **kwargs):
     """
     Signal handler to sync resource category to Odoo when created or updated.
     """
     if instance.resource_type == ResourceCategoryResourceTypeOptions.charge_item_definition.value:
-        odoo_category = OdooCategoryResource()
-        odoo_category.sync_category_to_odoo_api(instance)
+        _odoo_category.sync_category_to_odoo_api(instance)
 
 
-@receiver(post_save, sender=Organization)
+@receiver(post_save, sender=Organization, dispatch_uid="care_odoo.sync_organization_to_odoo")
 def sync_organization_to_odoo(sender, instance, created, **kwargs):
     """
     Signal handler to sync organization to Odoo as a partner when org_type is product_supplier.
     """
     if instance.org_type == OrganizationTypeChoices.product_supplier.value:
-        odoo_partner = OdooPartnerResource()
-        odoo_partner.sync_partner_to_odoo_api(instance)
+        _odoo_partner.sync_partner_to_odoo_api(instance)
 
 
-@receiver(post_save, sender=DeliveryOrder)
+@receiver(post_save, sender=DeliveryOrder, dispatch_uid="care_odoo.sync_delivery_order_to_odoo")
 def sync_delivery_order_to_odoo(sender, instance, created, **kwargs):
     """
     Signal handler to sync delivery order to Odoo as a vendor bill when completed.
@@ -192,14 +228,12 @@ def sync_delivery_order_to_odoo(sender, instance, created, **kwargs):
         and not instance.origin
         and not instance.patient
     ):
-        odoo_delivery_order = OdooDeliveryOrderResource()
-        odoo_delivery_order.sync_delivery_order_to_odoo_api(instance.external_id)
+        _odoo_delivery_order.sync_delivery_order_to_odoo_api(instance.external_id)
 
 
-@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Product, dispatch_uid="care_odoo.sync_product_to_odoo")
 def sync_product_to_odoo(sender, instance, created, **kwargs):
     """
     Signal handler to sync product to Odoo when it has a charge item definition.
     """
-    odoo_product = OdooProductProductResource()
-    odoo_product.sync_product_from_product_model(instance)
+    _odoo_product.sync_product_from_product_model(instance)
@@ -1,10 +1,20 @@
 import logging
+import time
 
+from care.emr.models.invoice import Invoice
+from care.emr.models.payment_reconciliation import PaymentReconciliation
 from celery import shared_task
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DatabaseError, InterfaceError
 from requests.exceptions import ConnectionError, Timeout
 
 from care_odoo.connector.connector import OdooConnector
+from care_odoo.resources.account_move.spec import AccountMoveReturnApiRequest
 from care_odoo.resources.account_move_payment.spec import AccountPaymentCancelApiRequest
+from care_odoo.resources.cash_session.cache import get_counters, get_current_session
+from care_odoo.settings import plugin_settings
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +25,9 @@ logger = logging.getLogger(__name__)
     max_retries=3,
     default_retry_delay=10,
     autoretry_for=(ConnectionError, Timeout),
+    acks_late=False,
+    soft_time_limit=40,
+    time_limit=60,
 )
 def verify_payment_exists_or_cleanup(self, payment_external_id: str) -> dict:
     """
@@ -30,10 +43,7 @@ def verify_payment_exists_or_cleanup(self, payment_external_id: str) -> dict:
     Returns:
         dict with status and action taken
     """
-    # Import here to avoid circular imports
-    from care.emr.models.payment_reconciliation import PaymentReconciliation
-
-    logger.info(
+    logger.debug(
         "Verifying payment exists in Care DB: %s",
         payment_external_id,
     )
@@ -43,7 +53,7 @@ def verify_payment_exists_or_cleanup(self, payment_external_id: str) -> dict:
     ).exists()
 
     if payment_exists:
-        logger.info(
+        logger.debug(
             "Payment %s exists in Care DB. No cleanup needed.",
             payment_external_id,
         )
@@ -98,6 +108,9 @@ def verify_payment_exists_or_cleanup(self, payment_external_id: str) -> dict:
     max_retries=3,
     default_retry_delay=10,
     autoretry_for=(ConnectionError, Timeout),
+    acks_late=False,
+    soft_time_limit=40,
+    time_limit=60,
 )
 def verify_invoice_exists_or_cleanup(self, invoice_external_id: str) -> dict:
     """
@@ -113,12 +126,7 @@ def verify_invoice_exists_or_cleanup(self, invoice_external_id: str) -> dict:
     Returns:
         dict with status and action taken
     """
-    # Import here to avoid circular imports
-    from care.emr.models.invoice import Invoice
-
-    from care_odoo.resources.account_move.spec import AccountMoveReturnApiRequest
-
-    logger.info(
+    logger.debug(
         "Verifying invoice exists in Care DB: %s",
         invoice_external_id,
     )
@@ -128,7 +136,7 @@ def verify_invoice_exists_or_cleanup(self, invoice_external_id: str) -> dict:
     ).exists()
 
     if invoice_exists:
-        logger.info(
+        logger.debug(
             "Invoice %s exists in Care DB. No cleanup needed.",
             invoice_external_id,
         )
@@ -175,3 +183,142 @@ def verify_invoice_exists_or_cleanup(self, invoice_external_id: str) -> dict:
         )
         # Re-raise to trigger Celery retry
         raise
+
+
+CLEANUP_VERIFY_TASKS = {
+    "invoice": verify_invoice_exists_or_cleanup,
+    "payment": verify_payment_exists_or_cleanup,
+}
+
+
+def _cleanup_queue() -> str | None:
+    """Return the configured cleanup queue, or None to let Celery route to the default queue."""
+    return plugin_settings.CARE_ODOO_CLEANUP_QUEUE or None
+
+
+def _cleanup_bucket_prefix(kind: str, bucket: int) -> str:
+    return f"odoo:cleanup:{kind}:{bucket}"
+
+
+def _cache_is_shared() -> bool:
+    """Return True if the default cache is visible to the Celery workers that run the batch."""
+    # Per-process and no-op backends would leave the batch task reading an empty bucket
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+def schedule_cleanup_verification(kind: str, external_id: str) -> None:
+    """
+    Queue a rollback cleanup check for an invoice or payment that was just synced to Odoo.
+
+    Records synced within the same cleanup window are collected in the cache and verified
+    together by a single batch task with a single query. If the cache backend is not shared
+    with the workers or cannot hold the batch, a dedicated verification task is scheduled for
+    the record instead.
+
+    Args:
+        kind: "invoice" or "payment"
+        external_id: The external_id of the Invoice or PaymentReconciliation
+    """
+    delay = plugin_settings.CARE_ODOO_CLEANUP_DELAY_SECONDS
+    window = max(delay, 1)
+    now = time.time()
+    bucket = int(now // window)
+    prefix = _cleanup_bucket_prefix(kind, bucket)
+    timeout = window * 4 + delay
+
+    if not _cache_is_shared():
+        CLEANUP_VERIFY_TASKS[kind].apply_async(args=[external_id], countdown=delay, queue=_cleanup_queue())
+        return
+
+    try:
+        cache.add(f"{prefix}:count", 0, timeout)
+        index = cache.incr(f"{prefix}:count")
+        cache.set(f"{prefix}:{index}", external_id, timeout)
+    except Exception as e:
+        logger.warning("Could not batch %s cleanup verification for %s: %s", kind, external_id, str(e))
+        CLEANUP_VERIFY_TASKS[kind].apply_async(args=[external_id], countdown=delay, queue=_cleanup_queue())
+        return
+
+    if cache.add(f"{prefix}:scheduled", True, timeout):
+        # The first record of the window schedules the batch to run once the window has closed
+        try:
+            verify_cleanup_batch.apply_async(
+                args=[kind, bucket],
+                countdown=(bucket + 1) * window - now + delay,
+                queue=_cleanup_queue(),
+            )
+        except Exception:
+            # Release the claim so the next record in the window schedules the batch
+            cache.delete(f"{prefix}:scheduled")
+            raise
+
+
+@shared_task(
+    bind=True,
+    name="care_odoo.tasks.verify_cleanup_batch",
+    max_retries=3,
+    default_retry_delay=10,
+    acks_late=False,
+)
+def verify_cleanup_batch(self, kind: str, bucket: int) -> dict:
+    """
+    Verify that every invoice or payment synced to Odoo within a cleanup window exists in Care.
+
+    Records missing from the Care database are handed to the per-record verification task,
+    which re-checks them and cancels them in Odoo with retries.
+
+    Args:
+        kind: "invoice" or "payment"
+        bucket: The cleanup window the records were collected in
+
+    Returns:
+        dict with the number of records verified and scheduled for cleanup
+    """
+    model = {"invoice": Invoice, "payment": PaymentReconciliation}[kind]
+    prefix = _cleanup_bucket_prefix(kind, bucket)
+    count = cache.get(f"{prefix}:count") or 0
+    item_keys = [f"{prefix}:{index}" for index in range(1, count + 1)]
+    external_ids = list(cache.get_many(item_keys).values())
+
+    try:
+        existing = {
+            str(external_id)
+            for external_id in model.objects.filter(external_id__in=external_ids).values_list("external_id", flat=True)
+        }
+    except (DatabaseError, InterfaceError) as e:
+        # Only the lookup is retried; nothing has been dispatched yet, so a retry sends no duplicates
+        raise self.retry(exc=e) from e
+
+    missing = [external_id for external_id in external_ids if external_id not in existing]
+    for external_id in missing:
+        CLEANUP_VERIFY_TASKS[kind].apply_async(args=[external_id], queue=_cleanup_queue())
+
+    cache.delete_many([*item_keys, f"{prefix}:count", f"{prefix}:scheduled"])
+
+    logger.info("Verified %d %s records in Care DB, %d need Odoo cleanup", len(external_ids), kind, len(missing))
+    return {
+        "status": "success",
+        "verified": len(external_ids),
+        "cleanup": len(missing),
+    }
+
+
+@shared_task(name="care_odoo.tasks.warm_cash_session_cache")
+def warm_cash_session_cache(
+    facility_external_id: str,
+    user_external_id: str | None = None,
+    counter_x_care_id: str | None = None,
+) -> None:
+    """
+    Populate the cached Odoo counter list (and optionally the user's current session)
+    so the follow-up requests from the billing dashboard are served from cache.
+
+    Args:
+        facility_external_id: The external_id of the Facility being opened (the counters cache
+            is shared by all facilities; kept so already queued tasks still run)
+        user_external_id: The external_id of the user, to warm their current session
+        counter_x_care_id: The counter the user is working at, to warm their current session
+    """
+    get_counters()
+    if user_external_id and counter_x_care_id:
+        get_current_session(user_external_id, counter_x_care_id)
@@ -0,0 +1,46 @@
+from unittest import mock
+
+from care.emr.models.invoice import Invoice
+from care.emr.resources.invoice.spec import InvoiceStatusOptions
+from django.test import SimpleTestCase
+
+from care_odoo import signals
+
+
+class InvoiceIssuedSyncTests(SimpleTestCase):
+    def _save(self, invoice, stored_row):
+        """Run the pre_save and post_save handlers with the given (status, locked) row in the database."""
+        with (
+            mock.patch.object(Invoice, "objects") as objects,
+            mock.patch.object(signals, "_odoo_invoice") as odoo_invoice,
+            mock.patch.object(signals, "schedule_cleanup_verification"),
+        ):
+            objects.filter.return_value.values_list.return_value.first.return_value = stored_row
+            signals.capture_previous_status(sender=Invoice, instance=invoice)
+            signals.save_fields_before_update(
+                sender=Invoice, instance=invoice, raw=False, using="default", update_fields=None
+            )
+        return odoo_invoice
+
+    def test_issue_after_refresh_from_db_syncs(self):
+        # Loaded while locked, so the post_init snapshot remembers locked=True
+        invoice = Invoice(id=1, status=InvoiceStatusOptions.draft.value, locked=True)
+        invoice._state.adding = False
+
+        # Unlocked by a queryset .update() and reloaded with refresh_from_db(), which
+        # assigns the new values without firing post_init on this instance
+        invoice.locked = False
+        invoice.status = InvoiceStatusOptions.issued.value
+
+        odoo_invoice = self._save(invoice, (InvoiceStatusOptions.draft.value, False))
+
+        odoo_invoice.sync_invoice_to_odoo_api.assert_called_once_with(str(invoice.external_id))
+
+    def test_issue_while_toggling_lock_skips_sync(self):
+        invoice = Invoice(id=1, status=InvoiceStatusOptions.issued.value, locked=False)
+        invoice._state.adding = False
+        invoice.locked = True
+
+        odoo_invoice = self._save(invoice, (InvoiceStatusOptions.issued.value, False))
+
+        odoo_invoice.sync_invoice_to_odoo_api.assert_not_called()
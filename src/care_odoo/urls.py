@@ -1,27 +1,34 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from django.views.decorators.cache import never_cache
+from rest_framework.routers import SimpleRouter
 
 from care_odoo.resources.cash_session.viewset import CashSessionViewSet
 from care_odoo.resources.cash_transfer.viewset import CashTransferViewSet
 from care_odoo.resources.payment_method_line.viewset import PaymentMethodLineViewSet
 
 
+# Health checks hit this often, so the body is encoded once
+PING_RESPONSE_BODY = b'{"status": "OK"}'
+
+
+@never_cache
 def ping(request):
-    return JsonResponse({"status": "OK"})
+    return HttpResponse(PING_RESPONSE_BODY, content_type="application/json")
 
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register("payment-method-line", PaymentMethodLineViewSet, basename="payment-method-line")
 
 # Facility-scoped router for cash management
-facility_router = DefaultRouter()
+facility_router = SimpleRouter()
 facility_router.register("cash-session", CashSessionViewSet, basename="cash-session")
 facility_router.register("cash-transfer", CashTransferViewSet, basename="cash-transfer")
 
 urlpatterns = [
     path("ping/", ping, name="ping"),
-    path("", include(router.urls)),
+    # Top-level routes are spliced in directly rather than through an empty-prefix include
+    *router.urls,
     path(
         "facility/<uuid:facility_external_id>/",
         include(facility_router.urls),